@@ -173,7 +173,7 @@ class SAMAgentOrchestrator:
         """
         trace_metadata = self._create_trace_metadata(state)
         span = None
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Node entry span
         try:
@@ -189,7 +189,7 @@ class SAMAgentOrchestrator:
         try:
             # Execute node
             result = node_fn(state)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             # Node exit span
             try:
@@ -205,7 +205,7 @@ class SAMAgentOrchestrator:
             return result
         except Exception as e:
             # Exception handling (node failure)
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
 
             # Record failure span
             try:
@@ -378,7 +378,7 @@ class SAMAgentOrchestrator:
         )
 
         trace_metadata = self._create_trace_metadata(state)
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Model call span (metadata only, no prompts/outputs)
         try:
@@ -395,7 +395,7 @@ class SAMAgentOrchestrator:
         model_response = self.model_backend.generate(request)
 
         # Record model call result (metadata only)
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
         try:
             success_status = "success" if model_response.status == "success" else "failure"
             self.tracer.record_event(
@@ -26,28 +26,22 @@ def compute_per_run_metrics(traces_by_session: Dict[str, List[Trace]]) -> Dict[s
     if not traces_by_session:
         raise ValueError("Must provide at least one session")
 
-    # Compute per-session metrics
+    # Compute per-session metrics, indexing valid values by metric as we go
     session_results = {}
-    all_metric_ids = set()
+    values_by_metric: Dict[str, List[float]] = {}
 
     for session_id, traces in traces_by_session.items():
         results = compute_per_session_metrics(traces)
         session_results[session_id] = results
-        all_metric_ids.update(results.results.keys())
+        for metric_id, metric_result in results.results.items():
+            values = values_by_metric.setdefault(metric_id, [])
+            if metric_result.valid:
+                values.append(metric_result.value)
 
     # Aggregate across sessions
     run_metrics = {}
 
-    for metric_id in all_metric_ids:
-        values = []
-
-        # Collect values from all sessions
-        for session_id, results in session_results.items():
-            if metric_id in results.results:
-                metric_result = results.results[metric_id]
-                if metric_result.valid:
-                    values.append(metric_result.value)
-
+    for metric_id, values in values_by_metric.items():
         if not values:
             run_metrics[metric_id] = {
                 "valid": False,
@@ -55,22 +49,29 @@ def compute_per_run_metrics(traces_by_session: Dict[str, List[Trace]]) -> Dict[s
             }
             continue
 
-        # Compute statistics
+        # Compute statistics (sort once; all order statistics read from it)
         sorted_values = sorted(values)
         n = len(sorted_values)
+        mid = n // 2
+        median = (
+            sorted_values[mid]
+            if n % 2
+            else (sorted_values[mid - 1] + sorted_values[mid]) / 2
+        )
 
         run_metrics[metric_id] = {
             "valid": True,
             "count": n,
             "mean": statistics.mean(values),
-            "median": statistics.median(values),
+            "median": median,
             "stdev": statistics.stdev(values) if n > 1 else 0.0,
-            "min": min(values),
-            "max": max(values),
+            "min": sorted_values[0],
+            "max": sorted_values[-1],
             "p25": sorted_values[n // 4] if n > 0 else None,
             "p50": sorted_values[n // 2] if n > 0 else None,
             "p75": sorted_values[(3 * n) // 4] if n > 0 else None,
             "p95": sorted_values[int(0.95 * n)] if n > 0 else None,
+            "p99": sorted_values[int(0.99 * n)] if n > 0 else None,
         }
 
     return {
@@ -128,10 +128,8 @@ class RegressionDetector:
         run_a_metrics = run_a_results.get("metrics", {})
         run_b_metrics = run_b_results.get("metrics", {})
 
-        for metric_id in set(list(run_a_metrics.keys()) + list(run_b_metrics.keys())):
-            if metric_id not in run_a_metrics or metric_id not in run_b_metrics:
-                continue
-
+        # Only metrics present in both runs are comparable
+        for metric_id in run_a_metrics.keys() & run_b_metrics.keys():
             metric_a = run_a_metrics[metric_id]
             metric_b = run_b_metrics[metric_id]
 
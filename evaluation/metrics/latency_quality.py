@@ -75,23 +75,21 @@ def compute_quality_adjusted_response_time(traces: List[Trace]) -> MetricResult:
             error="No traces provided",
         )
 
-    # Get turns to completion
+    # Get turns to completion and response latencies in a single pass
     total_turns = 0
     trace_count = 0
+    response_times = []
 
     for trace in traces:
         total_turns += len(trace.events)
         trace_count += 1
 
-    avg_turns = total_turns / trace_count if trace_count > 0 else 0.0
-
-    # Get median latency
-    response_times = []
-    for trace in traces:
         terminal_spans = get_terminal_spans(trace)
         for span in terminal_spans:
             response_times.append(span.duration_ms)
 
+    avg_turns = total_turns / trace_count if trace_count > 0 else 0.0
+
     if not response_times:
         return MetricResult(
             metric_id="quality_adjusted_response_time",
@@ -140,17 +138,17 @@ def compute_premature_optimization_rate(traces: List[Trace]) -> MetricResult:
     for trace in traces:
         terminal_spans = get_terminal_spans(trace)
 
+        # Check if followed by follow-up question (from events), once per trace
+        has_follow_up = any(
+            "follow_up" in str(e.event_type).lower() for e in trace.events
+        )
+
         for span in terminal_spans:
             # Fast response threshold: 1000ms
             if span.duration_ms < 1000:
                 fast_responses += 1
 
-                # Check if followed by follow-up question (from events)
-                follow_up_events = [
-                    e for e in trace.events if "follow_up" in str(e.event_type).lower()
-                ]
-
-                if follow_up_events:
+                if has_follow_up:
                     premature_optimizations += 1
 
     premature_rate = (
@@ -186,20 +184,18 @@ def compute_over_elaboration_rate(traces: List[Trace]) -> MetricResult:
     for trace in traces:
         terminal_spans = get_terminal_spans(trace)
 
+        # Check if trace has corrections (no improvement), once per trace
+        has_corrections = any(
+            "correction" in str(e.event_type).lower() for e in trace.events
+        )
+
         for span in terminal_spans:
             # Slow response threshold: 3000ms
             if span.duration_ms > 3000:
                 slow_responses += 1
 
-                # Check if trace has corrections (no improvement)
-                corrections = [
-                    e
-                    for e in trace.events
-                    if "correction" in str(e.event_type).lower()
-                ]
-
                 # Over-elaborated if slow AND still has corrections
-                if corrections:
+                if has_corrections:
                     over_elaborated += 1
 
     over_elaboration = (
@@ -277,6 +277,8 @@ class TestAggregation:
         if metric["valid"]:
             # Median should be between p25 and p75
             assert metric["p25"] <= metric["median"] <= metric["p75"]
+            # Tail percentiles are ordered and bounded by max
+            assert metric["p95"] <= metric["p99"] <= metric["max"]
             # Min should be <= mean <= max
             assert metric["min"] <= metric["mean"] <= metric["max"]
 
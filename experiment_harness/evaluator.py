@@ -44,7 +44,7 @@ class EvaluatorError(Exception):
         return msg
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricsResult:
     """Result of metric computation for a run."""
 
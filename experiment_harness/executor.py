@@ -37,7 +37,7 @@ class ExecutorError(Exception):
         return msg
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionRun:
     """Result of executing a single variant (baseline or variant)."""
 
@@ -85,6 +85,8 @@ class ExperimentExecutor:
             ExecutorError: If execution fails
         """
         try:
+            started_at = datetime.utcnow().isoformat()
+
             # In Phase 5.3.2, we simulate execution
             # In Phase 5.3.3+, this will actually run the agent
             traces = self._simulate_execution(
@@ -98,7 +100,7 @@ class ExperimentExecutor:
                 variant_id=spec.baseline_id,
                 experiment_id=spec.experiment_id,
                 traces=traces,
-                started_at=datetime.utcnow().isoformat(),
+                started_at=started_at,
                 completed_at=datetime.utcnow().isoformat(),
                 random_seed=random_seed,
                 dataset_hash=self.dataset_hash,
@@ -131,6 +133,8 @@ class ExperimentExecutor:
             ExecutorError: If execution fails
         """
         try:
+            started_at = datetime.utcnow().isoformat()
+
             # In Phase 5.3.2, we simulate execution
             # In Phase 5.3.3+, this will actually run the variant
             traces = self._simulate_execution(
@@ -145,7 +149,7 @@ class ExperimentExecutor:
                 variant_id=spec.variant_id,
                 experiment_id=spec.experiment_id,
                 traces=traces,
-                started_at=datetime.utcnow().isoformat(),
+                started_at=started_at,
                 completed_at=datetime.utcnow().isoformat(),
                 random_seed=random_seed,
                 dataset_hash=self.dataset_hash,
@@ -24,6 +24,21 @@ from evaluation.schemas.metric_schema import (
 )
 
 
+# Constant report sections (no substitutions), built once at import time.
+_RECOMMENDATION_NOTE_LINES = (
+    "> ⚠️ This is an evidence-based recommendation only.",
+    "> Final decision requires human review.",
+    "",
+)
+
+_REPORT_FOOTER_LINES = (
+    "## Evidence",
+    "",
+    "Full comparison details stored in JSON format.",
+    "Review evidence before making final decision.",
+)
+
+
 @dataclass(frozen=True)
 class ReporterError(Exception):
     """Reporter error with structured information."""
@@ -40,7 +55,7 @@ class ReporterError(Exception):
         return msg
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ComparisonReport:
     """Result of comparing baseline vs variant."""
 
@@ -292,9 +307,7 @@ class ComparisonReporter:
             "",
             f"**{report.recommendation}**",
             "",
-            "> ⚠️ This is an evidence-based recommendation only.",
-            "> Final decision requires human review.",
-            "",
+            *_RECOMMENDATION_NOTE_LINES,
         ]
 
         if report.improvements:
@@ -333,11 +346,6 @@ class ComparisonReporter:
                     lines.append(f"- {inc}")
             lines.append("")
 
-        lines.extend([
-            "## Evidence",
-            "",
-            "Full comparison details stored in JSON format.",
-            "Review evidence before making final decision.",
-        ])
+        lines.extend(_REPORT_FOOTER_LINES)
 
         return "\n".join(lines)
@@ -23,7 +23,7 @@ from experiments.protocol.schema import ExperimentSpec
 from experiment_harness.executor import ExecutionRun
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReproducibilityRecord:
     """Complete reproducibility information for a run."""
 
@@ -132,18 +132,9 @@ class ReproducibilityRecorder:
 
     def _spec_to_json(self, spec: ExperimentSpec) -> str:
         """Convert ExperimentSpec to JSON string."""
-        spec_dict = {
-            "experiment_id": spec.experiment_id,
-            "hypothesis": spec.hypothesis,
-            "changed_variable": spec.changed_variable,
-            "baseline_id": spec.baseline_id,
-            "variant_id": spec.variant_id,
-            "metrics_used": spec.metrics_used,
-            "minimum_runs": spec.minimum_runs,
-            "created_at": spec.created_at,
-            "author": spec.author,
-        }
-        return json.dumps(spec_dict, sort_keys=True)
+        # Fields come from the dataclass itself, so new spec fields are
+        # hashed without updating a hand-maintained list here.
+        return json.dumps(asdict(spec), sort_keys=True)
 
     def _save_record(self, record: ReproducibilityRecord) -> None:
         """Save reproducibility record to file."""
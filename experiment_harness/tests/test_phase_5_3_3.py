@@ -25,8 +25,46 @@ from datetime import datetime
 
 from experiment_harness.loader import SpecLoader
 from experiment_harness.phase_5_3_3_executor import Phase533Executor
-from experiments.protocol.schema import ExperimentSpec
-from experiments.protocol.validator import validate_experiment_spec
+from experiments.protocol.schema import ExperimentDecision, ExperimentRecord, ExperimentSpec
+from experiments.protocol.validator import validate_experiment_record, validate_experiment_spec
+
+
+# Specs shared by the validation tests, built once at import time.
+INVALID_MULTI_VAR_SPEC = ExperimentSpec(
+    experiment_id="exp-invalid-001",
+    hypothesis="Test invalid spec",
+    changed_variable="prompt AND timeout",  # INVALID: multiple variables
+    baseline_id="v1",
+    variant_id="variant-1",
+    metrics_used=["task_completion_rate"],
+    minimum_runs=5,
+    created_at=datetime.utcnow().isoformat(),
+    author="Test Author",
+)
+
+VALID_SINGLE_VAR_SPEC = ExperimentSpec(
+    experiment_id="EXP-001-minimal-prompt-clarity",
+    hypothesis="A minor clarity-oriented prompt adjustment...",
+    changed_variable="prompt_clarity_sentence",  # VALID: single variable
+    baseline_id="v1",
+    variant_id="prompt-clarity-v2",
+    metrics_used=["task_completion_rate", "correction_rate"],
+    minimum_runs=5,
+    created_at=datetime.utcnow().isoformat(),
+    author="SAM Infrastructure Team",
+)
+
+PROTOCOL_5_3_1_SPEC = ExperimentSpec(
+    experiment_id="EXP-001",
+    hypothesis="Test hypothesis with specific prediction",
+    changed_variable="single_variable",
+    baseline_id="v1",
+    variant_id="variant-1",
+    metrics_used=["task_completion_rate"],
+    minimum_runs=5,
+    created_at=datetime.utcnow().isoformat(),
+    author="Test Author",
+)
 
 
 class TestPhase533Infrastructure:
@@ -34,20 +72,7 @@ class TestPhase533Infrastructure:
 
     def test_spec_validation_rejects_multiple_variables(self):
         """Spec validator must reject multiple changed variables."""
-        spec_dict = {
-            "experiment_id": "exp-invalid-001",
-            "hypothesis": "Test invalid spec",
-            "changed_variable": "prompt AND timeout",  # INVALID: multiple variables
-            "baseline_id": "v1",
-            "variant_id": "variant-1",
-            "metrics_used": ["task_completion_rate"],
-            "minimum_runs": 5,
-            "created_at": datetime.utcnow().isoformat(),
-            "author": "Test Author",
-        }
-
-        spec = ExperimentSpec(**spec_dict)
-        result = validate_experiment_spec(spec)
+        result = validate_experiment_spec(INVALID_MULTI_VAR_SPEC)
 
         # Should fail validation
         assert not result.valid
@@ -55,24 +80,49 @@ class TestPhase533Infrastructure:
 
     def test_spec_validation_accepts_single_variable(self):
         """Spec validator must accept single changed variable."""
-        spec_dict = {
-            "experiment_id": "EXP-001-minimal-prompt-clarity",
-            "hypothesis": "A minor clarity-oriented prompt adjustment...",
-            "changed_variable": "prompt_clarity_sentence",  # VALID: single variable
-            "baseline_id": "v1",
-            "variant_id": "prompt-clarity-v2",
-            "metrics_used": ["task_completion_rate", "correction_rate"],
-            "minimum_runs": 5,
-            "created_at": datetime.utcnow().isoformat(),
-            "author": "SAM Infrastructure Team",
-        }
-
-        spec = ExperimentSpec(**spec_dict)
-        result = validate_experiment_spec(spec)
+        result = validate_experiment_spec(VALID_SINGLE_VAR_SPEC)
 
         # Should pass validation
         assert result.valid
 
+    def test_record_validation_fail_fast_stops_at_spec(self):
+        """fail_fast must return only spec errors when the spec is critically invalid."""
+        record = self._record_with_invalid_spec()
+
+        result = validate_experiment_record(record, fail_fast=True)
+
+        assert not result.valid
+        assert result == validate_experiment_spec(INVALID_MULTI_VAR_SPEC)
+        assert not any(e.field.startswith("decision") for e in result.errors)
+        assert not any(e.field == "variant_results_ref" for e in result.errors)
+
+    def test_record_validation_default_reports_all_errors(self):
+        """Without fail_fast, decision and ref errors are reported alongside spec errors."""
+        record = self._record_with_invalid_spec()
+
+        result = validate_experiment_record(record)
+        fields = {e.field for e in result.errors}
+
+        assert not result.valid
+        assert "changed_variable" in fields
+        assert "decision.justification" in fields
+        assert "variant_results_ref" in fields
+
+    @staticmethod
+    def _record_with_invalid_spec() -> ExperimentRecord:
+        """Record whose spec, decision and result refs all fail validation."""
+        return ExperimentRecord(
+            spec=INVALID_MULTI_VAR_SPEC,
+            baseline_results_ref="run-a",
+            variant_results_ref="run-a",  # INVALID: same as baseline
+            decision=ExperimentDecision(
+                outcome="ACCEPT",
+                justification="x" * 60,  # INVALID: no metric reference
+                reviewer="Test Reviewer",
+                decided_at=datetime.utcnow().isoformat(),
+            ),
+        )
+
     def test_executor_loads_fixed_dataset(self):
         """Executor must load fixed dataset with deterministic hash."""
         executor = Phase533Executor()
@@ -290,21 +340,7 @@ class TestPhase533Infrastructure:
         # 3. Minimum runs >= 30 recommended
         # 4. Hypothesis is falsifiable
         # 5. All required fields provided
-
-        spec_dict = {
-            "experiment_id": "EXP-001",
-            "hypothesis": "Test hypothesis with specific prediction",
-            "changed_variable": "single_variable",
-            "baseline_id": "v1",
-            "variant_id": "variant-1",
-            "metrics_used": ["task_completion_rate"],
-            "minimum_runs": 5,
-            "created_at": datetime.utcnow().isoformat(),
-            "author": "Test Author",
-        }
-
-        spec = ExperimentSpec(**spec_dict)
-        result = validate_experiment_spec(spec)
+        result = validate_experiment_spec(PROTOCOL_5_3_1_SPEC)
 
         # Validation must pass
         assert result.valid
@@ -8,7 +8,7 @@ This schema makes experiments first-class, inspectable objects.
 """
 
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from enum import Enum
 
 
@@ -20,7 +20,43 @@ class ExperimentOutcome(str, Enum):
     INCONCLUSIVE = "INCONCLUSIVE"
 
 
-@dataclass(frozen=True)
+# Precomputed lookup sets for membership checks
+VALID_OUTCOMES = frozenset(e.value for e in ExperimentOutcome)
+VALID_REGISTRY_STATUSES = frozenset({"proposed", "evaluated", "accepted", "rejected"})
+
+
+def _check_required_fields(obj: object, fields: Tuple[Tuple[str, int], ...]) -> None:
+    """
+    Check required string fields against a (field_name, min_length) table.
+
+    Raises:
+        ValueError: On the first field that is missing or too short
+    """
+    for name, min_length in fields:
+        value = getattr(obj, name)
+        if min_length > 1:
+            if not value or len(value.strip()) < min_length:
+                raise ValueError(f"{name} must be at least {min_length} characters")
+        elif not value or value.isspace():
+            raise ValueError(f"{name} cannot be empty")
+
+
+# (field_name, min_length) checked at instantiation, in declaration order
+_SPEC_REQUIRED_FIELDS = (
+    ("experiment_id", 1),
+    ("hypothesis", 10),
+    ("changed_variable", 1),
+    ("baseline_id", 1),
+    ("variant_id", 1),
+    ("created_at", 1),
+    ("author", 1),
+)
+_DECISION_REQUIRED_FIELDS = (("reviewer", 1), ("decided_at", 1))
+_RECORD_REQUIRED_FIELDS = (("baseline_results_ref", 1), ("variant_results_ref", 1))
+_REGISTRY_REQUIRED_FIELDS = (("experiment_id", 1), ("created_at", 1))
+
+
+@dataclass(frozen=True, slots=True)
 class ExperimentSpec:
     """
     Specification for a proposed experiment.
@@ -51,27 +87,14 @@ class ExperimentSpec:
 
     def __post_init__(self):
         """Validate basic constraints at instantiation."""
-        if not self.experiment_id or not self.experiment_id.strip():
-            raise ValueError("experiment_id cannot be empty")
-        if not self.hypothesis or len(self.hypothesis.strip()) < 10:
-            raise ValueError("hypothesis must be at least 10 characters")
-        if not self.changed_variable or not self.changed_variable.strip():
-            raise ValueError("changed_variable cannot be empty")
-        if not self.baseline_id or not self.baseline_id.strip():
-            raise ValueError("baseline_id cannot be empty")
-        if not self.variant_id or not self.variant_id.strip():
-            raise ValueError("variant_id cannot be empty")
-        if not self.metrics_used or len(self.metrics_used) == 0:
+        _check_required_fields(self, _SPEC_REQUIRED_FIELDS)
+        if not self.metrics_used:
             raise ValueError("metrics_used cannot be empty")
         if self.minimum_runs < 1:
             raise ValueError("minimum_runs must be at least 1")
-        if not self.created_at or not self.created_at.strip():
-            raise ValueError("created_at cannot be empty")
-        if not self.author or not self.author.strip():
-            raise ValueError("author cannot be empty")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperimentDecision:
     """
     Decision outcome for a completed experiment.
@@ -90,7 +113,7 @@ class ExperimentDecision:
 
     def __post_init__(self):
         """Validate decision constraints."""
-        if self.outcome not in {e.value for e in ExperimentOutcome}:
+        if self.outcome not in VALID_OUTCOMES:
             raise ValueError(
                 f"outcome must be one of {[e.value for e in ExperimentOutcome]}, got {self.outcome}"
             )
@@ -98,13 +121,10 @@ class ExperimentDecision:
             raise ValueError(
                 "justification is required and must be at least 50 characters"
             )
-        if not self.reviewer or not self.reviewer.strip():
-            raise ValueError("reviewer cannot be empty")
-        if not self.decided_at or not self.decided_at.strip():
-            raise ValueError("decided_at cannot be empty")
+        _check_required_fields(self, _DECISION_REQUIRED_FIELDS)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperimentRecord:
     """
     Complete audit trail for an experiment.
@@ -128,14 +148,11 @@ class ExperimentRecord:
 
     def __post_init__(self):
         """Validate record constraints."""
-        if not self.baseline_results_ref or not self.baseline_results_ref.strip():
-            raise ValueError("baseline_results_ref cannot be empty")
-        if not self.variant_results_ref or not self.variant_results_ref.strip():
-            raise ValueError("variant_results_ref cannot be empty")
+        _check_required_fields(self, _RECORD_REQUIRED_FIELDS)
         # spec and decision are validated by their own __post_init__
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExperimentRegistryEntry:
     """
     Minimal registry entry for traceability.
@@ -156,16 +173,12 @@ class ExperimentRegistryEntry:
 
     def __post_init__(self):
         """Validate registry entry."""
-        if not self.experiment_id or not self.experiment_id.strip():
-            raise ValueError("experiment_id cannot be empty")
-        valid_statuses = {"proposed", "evaluated", "accepted", "rejected"}
-        if self.status not in valid_statuses:
+        _check_required_fields(self, _REGISTRY_REQUIRED_FIELDS)
+        if self.status not in VALID_REGISTRY_STATUSES:
             raise ValueError(
-                f"status must be one of {valid_statuses}, got {self.status}"
+                f"status must be one of {sorted(VALID_REGISTRY_STATUSES)}, got {self.status}"
             )
-        if not self.created_at or not self.created_at.strip():
-            raise ValueError("created_at cannot be empty")
-        if self.decided_at is not None and not self.decided_at.strip():
+        if self.decided_at is not None and (not self.decided_at or self.decided_at.isspace()):
             raise ValueError("decided_at must be non-empty if provided")
 
 
@@ -173,7 +186,7 @@ class ExperimentRegistryEntry:
 # This is imported from evaluation/schemas/metric_schema.py
 # For now, we define the expected metrics (must match Phase 5.2)
 
-VALID_PHASE_5_2_METRICS = {
+VALID_PHASE_5_2_METRICS = frozenset({
     # Task Completion Effectiveness
     "task_completion_rate",
     "correction_rate",
@@ -199,7 +212,7 @@ VALID_PHASE_5_2_METRICS = {
     "quality_adjusted_response_time",
     "premature_optimization_rate",
     "over_elaboration_rate",
-}
+})
 
 
 def is_valid_phase_5_2_metric(metric_id: str) -> bool:
@@ -12,18 +12,41 @@ These functions:
 Their only purpose: prevent invalid experiments from existing.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 from experiments.protocol.schema import (
     ExperimentSpec,
     ExperimentDecision,
     ExperimentRecord,
     ExperimentOutcome,
+    VALID_OUTCOMES,
     VALID_PHASE_5_2_METRICS,
 )
 
 
-@dataclass(frozen=True)
+# Keyword checks, compiled once so each rule is a single case-insensitive scan.
+# changed_variable must not combine variables: " and ", " or ", ",", " plus ", " with ", " &"
+_MULTIPLE_VARS_RE = re.compile(r" and | or |,| plus | with | &", re.IGNORECASE)
+
+# ACCEPT justification must reference metrics or data
+_METRIC_REFERENCE_RE = re.compile(
+    r"metric|percentage|%|improved|within range|acceptable|baseline|comparison",
+    re.IGNORECASE,
+)
+
+# Phrases that make a justification too generic
+_GENERIC_JUSTIFICATION_RE = re.compile(
+    r"looks good|seems okay|probably works|i think|maybe|should be fine",
+    re.IGNORECASE,
+)
+
+# Registry listing for the invalid-metrics error message
+_VALID_METRICS_LISTING = str(sorted(VALID_PHASE_5_2_METRICS))
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     """Result of a failed validation."""
 
@@ -32,16 +55,25 @@ class ValidationError:
     severity: str  # "error" or "warning"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of validation (success or errors)."""
 
-    valid: bool
-    errors: List[ValidationError]
+    # Derived from errors at construction: valid iff no error has severity "error"
+    valid: bool = field(init=False)
+    # Stored as a tuple so valid cannot go stale after construction
+    errors: Tuple[ValidationError, ...]
+
+    def __post_init__(self):
+        """Freeze the error list and derive valid in a single scan."""
+        object.__setattr__(self, "errors", tuple(self.errors))
+        object.__setattr__(
+            self, "valid", not any(e.severity == "error" for e in self.errors)
+        )
 
     def has_critical_errors(self) -> bool:
         """Check if any critical errors (not just warnings)."""
-        return any(e.severity == "error" for e in self.errors)
+        return not self.valid
 
 
 def validate_experiment_spec(spec: ExperimentSpec) -> ValidationResult:
@@ -62,16 +94,7 @@ def validate_experiment_spec(spec: ExperimentSpec) -> ValidationResult:
     errors: List[ValidationError] = []
 
     # Rule 1: changed_variable must be singular
-    changed_var = spec.changed_variable.lower()
-    singular_check_keywords = [
-        " and ",
-        " or ",
-        ",",
-        " plus ",
-        " with ",
-        " &",
-    ]
-    contains_multiple_vars = any(kw in changed_var for kw in singular_check_keywords)
+    contains_multiple_vars = _MULTIPLE_VARS_RE.search(spec.changed_variable) is not None
 
     if contains_multiple_vars:
         errors.append(
@@ -85,14 +108,14 @@ def validate_experiment_spec(spec: ExperimentSpec) -> ValidationResult:
         )
 
     # Rule 2: metrics_used must be valid Phase 5.2 metrics
-    invalid_metrics = [m for m in spec.metrics_used if m not in VALID_PHASE_5_2_METRICS]
-
-    if invalid_metrics:
+    # Subset check covers the common all-valid case; offenders are listed only on failure
+    if not VALID_PHASE_5_2_METRICS.issuperset(spec.metrics_used):
+        invalid_metrics = [m for m in spec.metrics_used if m not in VALID_PHASE_5_2_METRICS]
         errors.append(
             ValidationError(
                 field="metrics_used",
                 error=f"Metrics not in Phase 5.2 registry: {invalid_metrics}. "
-                f"Valid metrics: {sorted(VALID_PHASE_5_2_METRICS)}",
+                f"Valid metrics: {_VALID_METRICS_LISTING}",
                 severity="error",
             )
         )
@@ -161,7 +184,7 @@ def validate_experiment_spec(spec: ExperimentSpec) -> ValidationResult:
     }
 
     for field_name, field_value in required_fields.items():
-        if not field_value or not field_value.strip():
+        if not field_value or field_value.isspace():
             errors.append(
                 ValidationError(
                     field=field_name,
@@ -171,8 +194,7 @@ def validate_experiment_spec(spec: ExperimentSpec) -> ValidationResult:
             )
 
     # Return result
-    has_critical_errors = any(e.severity == "error" for e in errors)
-    return ValidationResult(valid=not has_critical_errors, errors=errors)
+    return ValidationResult(errors=errors)
 
 
 def validate_decision(
@@ -196,12 +218,12 @@ def validate_decision(
     decision = record.decision
 
     # Rule 1: outcome must be valid
-    valid_outcomes = {e.value for e in ExperimentOutcome}
-    if decision.outcome not in valid_outcomes:
+    if decision.outcome not in VALID_OUTCOMES:
         errors.append(
             ValidationError(
                 field="decision.outcome",
-                error=f"outcome must be one of {valid_outcomes}. Got: '{decision.outcome}'",
+                error=f"outcome must be one of {sorted(VALID_OUTCOMES)}. "
+                f"Got: '{decision.outcome}'",
                 severity="error",
             )
         )
@@ -222,19 +244,8 @@ def validate_decision(
     # But we can check that ACCEPT has strong justification
     if decision.outcome == ExperimentOutcome.ACCEPT.value:
         # Justification should mention metrics or data
-        justification_lower = decision.justification.lower()
-        has_metric_reference = any(
-            keyword in justification_lower
-            for keyword in [
-                "metric",
-                "percentage",
-                "%",
-                "improved",
-                "within range",
-                "acceptable",
-                "baseline",
-                "comparison",
-            ]
+        has_metric_reference = (
+            _METRIC_REFERENCE_RE.search(decision.justification) is not None
         )
 
         if not has_metric_reference:
@@ -248,7 +259,7 @@ def validate_decision(
             )
 
     # Rule 4: reviewer and decided_at must be provided
-    if not decision.reviewer or not decision.reviewer.strip():
+    if not decision.reviewer or decision.reviewer.isspace():
         errors.append(
             ValidationError(
                 field="decision.reviewer",
@@ -257,7 +268,7 @@ def validate_decision(
             )
         )
 
-    if not decision.decided_at or not decision.decided_at.strip():
+    if not decision.decided_at or decision.decided_at.isspace():
         errors.append(
             ValidationError(
                 field="decision.decided_at",
@@ -268,16 +279,7 @@ def validate_decision(
 
     # Rule 5: justification should be specific
     if decision.justification:
-        too_generic = [
-            "looks good",
-            "seems okay",
-            "probably works",
-            "i think",
-            "maybe",
-            "should be fine",
-        ]
-        justification_lower = decision.justification.lower()
-        if any(phrase in justification_lower for phrase in too_generic):
+        if _GENERIC_JUSTIFICATION_RE.search(decision.justification):
             errors.append(
                 ValidationError(
                     field="decision.justification",
@@ -288,16 +290,22 @@ def validate_decision(
             )
 
     # Return result
-    has_critical_errors = any(e.severity == "error" for e in errors)
-    return ValidationResult(valid=not has_critical_errors, errors=errors)
+    return ValidationResult(errors=errors)
 
 
-def validate_experiment_record(record: ExperimentRecord) -> ValidationResult:
+def validate_experiment_record(
+    record: ExperimentRecord, fail_fast: bool = False
+) -> ValidationResult:
     """
     Validate a complete ExperimentRecord (spec + decision).
 
     Combines validation of spec and decision, plus checks for consistency.
 
+    Args:
+        record: ExperimentRecord to validate
+        fail_fast: If True, return the spec result as soon as the spec has
+            critical errors instead of validating the rest of the record
+
     Rules:
     1. Spec must be valid (call validate_experiment_spec)
     2. Decision must be valid (call validate_decision)
@@ -311,6 +319,8 @@ def validate_experiment_record(record: ExperimentRecord) -> ValidationResult:
 
     # Validate spec
     spec_validation = validate_experiment_spec(record.spec)
+    if fail_fast and spec_validation.has_critical_errors():
+        return spec_validation
     all_errors.extend(spec_validation.errors)
 
     # Validate decision
@@ -318,7 +328,7 @@ def validate_experiment_record(record: ExperimentRecord) -> ValidationResult:
     all_errors.extend(decision_validation.errors)
 
     # Validate results references
-    if not record.baseline_results_ref or not record.baseline_results_ref.strip():
+    if not record.baseline_results_ref or record.baseline_results_ref.isspace():
         all_errors.append(
             ValidationError(
                 field="baseline_results_ref",
@@ -327,7 +337,7 @@ def validate_experiment_record(record: ExperimentRecord) -> ValidationResult:
             )
         )
 
-    if not record.variant_results_ref or not record.variant_results_ref.strip():
+    if not record.variant_results_ref or record.variant_results_ref.isspace():
         all_errors.append(
             ValidationError(
                 field="variant_results_ref",
@@ -337,10 +347,8 @@ def validate_experiment_record(record: ExperimentRecord) -> ValidationResult:
         )
 
     # Check that baseline and variant are different
-    if (
-        record.baseline_results_ref.strip() == record.variant_results_ref.strip()
-        and record.baseline_results_ref.strip()
-    ):
+    baseline_ref = record.baseline_results_ref.strip()
+    if baseline_ref and baseline_ref == record.variant_results_ref.strip():
         all_errors.append(
             ValidationError(
                 field="variant_results_ref",
@@ -351,8 +359,7 @@ def validate_experiment_record(record: ExperimentRecord) -> ValidationResult:
         )
 
     # Return combined result
-    has_critical_errors = any(e.severity == "error" for e in all_errors)
-    return ValidationResult(valid=not has_critical_errors, errors=all_errors)
+    return ValidationResult(errors=all_errors)
 
 
 def print_validation_errors(result: ValidationResult, spec_label: str = "Experiment") -> None:
@@ -367,26 +374,21 @@ def print_validation_errors(result: ValidationResult, spec_label: str = "Experim
         print(f"✅ {spec_label} is VALID")
         return
 
-    print(f"❌ {spec_label} has validation errors:")
-    print()
+    lines = [f"❌ {spec_label} has validation errors:", ""]
 
     # Group by severity
-    errors_by_severity = {}
+    errors_by_severity = defaultdict(list)
     for error in result.errors:
-        if error.severity not in errors_by_severity:
-            errors_by_severity[error.severity] = []
         errors_by_severity[error.severity].append(error)
 
-    # Print critical errors first
-    if "error" in errors_by_severity:
-        print("🚨 CRITICAL ERRORS:")
-        for error in errors_by_severity["error"]:
-            print(f"  [{error.field}] {error.error}")
-        print()
-
-    # Then warnings
-    if "warning" in errors_by_severity:
-        print("⚠️  WARNINGS:")
-        for error in errors_by_severity["warning"]:
-            print(f"  [{error.field}] {error.error}")
-        print()
+    # Critical errors first, then warnings
+    for severity, heading in (("error", "🚨 CRITICAL ERRORS:"), ("warning", "⚠️  WARNINGS:")):
+        if severity in errors_by_severity:
+            lines.append(heading)
+            lines.extend(
+                f"  [{error.field}] {error.error}" for error in errors_by_severity[severity]
+            )
+            lines.append("")
+
+    # Single write instead of one print per line
+    print("\n".join(lines))
@@ -1,4 +1,8 @@
+from collections import OrderedDict
+
 import requests
+from requests.adapters import HTTPAdapter
+
 from .base import ModelBackend
 from .types import ModelRequest, ModelResponse
 
@@ -11,16 +15,46 @@ class OllamaModelBackend(ModelBackend):
     Requires Ollama to be running at the specified base_url.
     """
 
-    def __init__(self, model_name: str, base_url: str = "http://localhost:11434"):
+    def __init__(
+        self,
+        model_name: str,
+        base_url: str = "http://localhost:11434",
+        cache_size: int = 0,
+    ):
         """
         Initialize Ollama backend.
         
         Args:
             model_name: Name of the model to use (e.g., "phi3:mini", "llama2")
             base_url: Base URL of Ollama service
+            cache_size: Max successful outputs kept for exact (task, prompt)
+                reuse; requests with context or constraints bypass the cache
+                (0 disables caching; sampling makes outputs non-deterministic)
         """
         self.model_name = model_name
         self.base_url = base_url
+        self._generate_url = f"{base_url}/api/generate"
+        self._base_metadata = {"backend": "ollama", "model": model_name}
+
+        # Keep-alive session so sequential generations reuse one connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # LRU of (task, prompt) -> output, most recently used last
+        self._cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], str] = OrderedDict()
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections held by this backend."""
+        self._session.close()
+
+    def __enter__(self) -> "OllamaModelBackend":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def generate(self, request: ModelRequest) -> ModelResponse:
         """
@@ -32,6 +66,22 @@ class OllamaModelBackend(ModelBackend):
         Returns:
             ModelResponse with output from Ollama or explicit error status
         """
+        metadata = {**self._base_metadata, "trace_id": request.trace_id}
+
+        # Only plain prompts are cached: context and constraints would change
+        # the answer as soon as they are forwarded to the model.
+        cache_key = None
+        if self._cache_size and request.context is None and not request.constraints:
+            cache_key = (request.task, request.prompt)
+            cached_output = self._cache.get(cache_key)
+            if cached_output is not None:
+                self._cache.move_to_end(cache_key)
+                return ModelResponse(
+                    status="success",
+                    output=cached_output,
+                    metadata={**metadata, "cached": True},
+                )
+
         try:
             payload = {
                 "model": self.model_name,
@@ -39,44 +89,48 @@ class OllamaModelBackend(ModelBackend):
                 "stream": False,
             }
 
-            resp = requests.post(
-                f"{self.base_url}/api/generate",
+            resp = self._session.post(
+                self._generate_url,
                 json=payload,
                 timeout=request.timeout_s,
             )
 
-            resp.raise_for_status()
+            # Fail fast on HTTP errors without raising or parsing the body
+            if resp.status_code >= 400:
+                return ModelResponse(
+                    status="fatal_error",
+                    error_type="backend_unavailable",
+                    metadata={
+                        **metadata,
+                        "error": f"HTTP {resp.status_code} from {self._generate_url}",
+                        "http_status": resp.status_code,
+                    },
+                )
+
             data = resp.json()
+            output = data.get("response", "")
+
+            if cache_key is not None:
+                self._cache[cache_key] = output
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
 
             return ModelResponse(
                 status="success",
-                output=data.get("response", ""),
-                metadata={
-                    "backend": "ollama",
-                    "model": self.model_name,
-                    "trace_id": request.trace_id
-                },
+                output=output,
+                metadata=metadata,
             )
 
         except requests.Timeout:
             return ModelResponse(
                 status="recoverable_error",
                 error_type="timeout",
-                metadata={
-                    "backend": "ollama",
-                    "model": self.model_name,
-                    "trace_id": request.trace_id
-                },
+                metadata=metadata,
             )
 
         except Exception as e:
             return ModelResponse(
                 status="fatal_error",
                 error_type="backend_unavailable",
-                metadata={
-                    "backend": "ollama",
-                    "model": self.model_name,
-                    "error": str(e),
-                    "trace_id": request.trace_id
-                },
+                metadata={**metadata, "error": str(e)},
             )
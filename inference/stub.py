@@ -20,24 +20,26 @@ class StubModelBackend(ModelBackend):
         Returns:
             ModelResponse with deterministic output based on task
         """
+        metadata = {"backend": "stub", "trace_id": request.trace_id}
+
         # Deterministic behavior based on task
         if request.task == "respond":
             return ModelResponse(
                 status="success",
                 output="This is a stubbed response.",
-                metadata={"backend": "stub", "trace_id": request.trace_id}
+                metadata=metadata,
             )
 
         if request.task == "fail":
             return ModelResponse(
                 status="recoverable_error",
                 error_type="invalid_output",
-                metadata={"backend": "stub", "trace_id": request.trace_id}
+                metadata=metadata,
             )
 
         # Default stub output for any other task
         return ModelResponse(
             status="success",
             output=f"Default stub output for task: {request.task}",
-            metadata={"backend": "stub", "trace_id": request.trace_id}
+            metadata=metadata,
         )
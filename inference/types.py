@@ -1,10 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, Literal
 
 ModelStatus = Literal["success", "recoverable_error", "fatal_error"]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelRequest:
     task: str                  # e.g. "respond", "summarize", "extract"
     prompt: str
@@ -14,9 +14,9 @@ class ModelRequest:
     trace_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModelResponse:
     status: ModelStatus
     output: Optional[str] = None
     error_type: Optional[str] = None   # timeout | invalid_output | backend_unavailable
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
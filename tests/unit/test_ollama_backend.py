@@ -0,0 +1,151 @@
+"""
+Test suite for OllamaModelBackend.
+
+The HTTP session is patched, so these tests never reach a real Ollama
+server.
+
+Tests focus on:
+- Exact-prompt response cache (hits, LRU eviction, bypass rules)
+- Error responses are never cached
+- HTTP error statuses map to explicit fatal errors
+- The pooled session is released on close
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from inference import OllamaModelBackend, ModelRequest
+
+
+def _ok(output):
+    """Build a mocked successful /api/generate response."""
+    resp = MagicMock()
+    resp.status_code = 200
+    resp.json.return_value = {"response": output}
+    return resp
+
+
+def test_cache_disabled_by_default():
+    """Without cache_size every call reaches Ollama."""
+    backend = OllamaModelBackend(model_name="test-model")
+
+    with patch.object(backend._session, "post", return_value=_ok("hi")) as post:
+        backend.generate(ModelRequest(task="respond", prompt="Hello"))
+        response = backend.generate(ModelRequest(task="respond", prompt="Hello"))
+
+    assert post.call_count == 2
+    assert "cached" not in response.metadata
+
+
+def test_cache_hit_skips_request():
+    """A repeated prompt is served from the cache and tagged as cached."""
+    backend = OllamaModelBackend(model_name="test-model", cache_size=2)
+
+    with patch.object(backend._session, "post", return_value=_ok("hi")) as post:
+        first = backend.generate(ModelRequest(task="respond", prompt="Hello", trace_id="t1"))
+        second = backend.generate(ModelRequest(task="respond", prompt="Hello", trace_id="t2"))
+
+    assert post.call_count == 1
+    assert first.metadata.get("cached") is None
+    assert second.status == "success"
+    assert second.output == "hi"
+    assert second.metadata["cached"] is True
+    assert second.metadata["trace_id"] == "t2"
+
+
+def test_cache_evicts_least_recently_used():
+    """The least recently used prompt is evicted once cache_size is exceeded."""
+    backend = OllamaModelBackend(model_name="test-model", cache_size=2)
+
+    with patch.object(backend._session, "post", return_value=_ok("out")) as post:
+        backend.generate(ModelRequest(task="respond", prompt="a"))
+        backend.generate(ModelRequest(task="respond", prompt="b"))
+        backend.generate(ModelRequest(task="respond", prompt="a"))  # hit, "b" is now oldest
+        backend.generate(ModelRequest(task="respond", prompt="c"))  # evicts "b"
+        assert post.call_count == 3
+
+        backend.generate(ModelRequest(task="respond", prompt="a"))
+        assert post.call_count == 3
+
+        backend.generate(ModelRequest(task="respond", prompt="b"))
+        assert post.call_count == 4
+
+
+def test_cache_keyed_on_task():
+    """The same prompt under a different task is not a cache hit."""
+    backend = OllamaModelBackend(model_name="test-model", cache_size=4)
+
+    with patch.object(backend._session, "post", return_value=_ok("out")) as post:
+        backend.generate(ModelRequest(task="respond", prompt="Hello"))
+        backend.generate(ModelRequest(task="summarize", prompt="Hello"))
+
+    assert post.call_count == 2
+
+
+def test_cache_bypassed_with_context_or_constraints():
+    """Requests carrying context or constraints are never cached."""
+    backend = OllamaModelBackend(model_name="test-model", cache_size=4)
+
+    with patch.object(backend._session, "post", return_value=_ok("out")) as post:
+        for _ in range(2):
+            backend.generate(ModelRequest(task="respond", prompt="Hello", context="prior turn"))
+            backend.generate(
+                ModelRequest(task="respond", prompt="Hello", constraints={"max_tokens": 10})
+            )
+
+    assert post.call_count == 4
+
+
+def test_errors_are_not_cached():
+    """Timeouts and HTTP errors must not populate the cache."""
+    backend = OllamaModelBackend(model_name="test-model", cache_size=4)
+    request = ModelRequest(task="respond", prompt="Hello")
+
+    error_resp = MagicMock()
+    error_resp.status_code = 503
+
+    with patch.object(
+        backend._session,
+        "post",
+        side_effect=[requests.Timeout(), error_resp, _ok("hi"), _ok("unused")],
+    ) as post:
+        assert backend.generate(request).status == "recoverable_error"
+        assert backend.generate(request).status == "fatal_error"
+        assert backend.generate(request).output == "hi"
+        assert backend.generate(request).metadata["cached"] is True
+
+    assert post.call_count == 3
+
+
+@pytest.mark.parametrize("status_code", [404, 500, 503])
+def test_http_error_status_returns_fatal_error(status_code):
+    """4xx/5xx responses return fatal_error with the HTTP status, without parsing the body."""
+    backend = OllamaModelBackend(model_name="test-model")
+
+    error_resp = MagicMock()
+    error_resp.status_code = status_code
+
+    with patch.object(backend._session, "post", return_value=error_resp):
+        response = backend.generate(ModelRequest(task="respond", prompt="Hello", trace_id="t1"))
+
+    assert response.status == "fatal_error"
+    assert response.error_type == "backend_unavailable"
+    assert response.metadata["http_status"] == status_code
+    assert response.metadata["trace_id"] == "t1"
+    error_resp.json.assert_not_called()
+
+
+def test_close_releases_session():
+    """close() and the context manager both close the pooled session."""
+    backend = OllamaModelBackend(model_name="test-model")
+    with patch.object(backend._session, "close") as close:
+        backend.close()
+    close.assert_called_once()
+
+    backend = OllamaModelBackend(model_name="test-model")
+    with patch.object(backend._session, "close") as close:
+        with backend:
+            pass
+    close.assert_called_once()